@@ -10,19 +10,142 @@ Requested by: Forge
 Date: January 18, 2026
 """
 
+import bisect
+import functools
 import json
+import os
+import sys
 from pathlib import Path
 from collections import defaultdict, Counter
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 import csv
+from concurrent.futures import ThreadPoolExecutor
 
 VERSION = "1.0.0"
 
 # Default Synapse path
 DEFAULT_SYNAPSE_PATH = Path("D:/BEACON_HQ/MEMORY_CORE_V2/03_INTER_AI_COMMS/THE_SYNAPSE/active")
 
+# Worker threads used to read message files
+LOAD_WORKERS = 8
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' natively
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(value: str) -> datetime:
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp, or return None if missing or invalid."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return _fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _to_epoch(moment: Optional[datetime]) -> Optional[float]:
+    """POSIX timestamp of a datetime (naive means local time), or None."""
+    if moment is None:
+        return None
+    try:
+        return moment.timestamp()
+    except (OverflowError, OSError, ValueError):
+        # Out of range for the platform clock (e.g. pre-1970 on Windows)
+        return None
+
+
+def _local_day(moment: Optional[datetime]) -> Optional[int]:
+    """Local calendar day ordinal of a datetime (naive means local), or None."""
+    if moment is None:
+        return None
+    if moment.tzinfo is not None:
+        try:
+            moment = moment.astimezone()
+        except (OverflowError, OSError, ValueError):
+            return None
+    return moment.toordinal()
+
+
+def _memoized(method):
+    """Cache a query method's result on the instance until reload()."""
+    @functools.wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._cache:
+            self._cache[method.__name__] = method(self)
+        return self._cache[method.__name__]
+    return wrapper
+
+
+def _warn_skipped(path: str, reason: Any):
+    """Report a message file that could not be loaded."""
+    print(f"[WARN] Skipping {Path(path).name}: {reason}", file=sys.stderr)
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values so repeated agent names share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _string_field(data: Dict[str, Any], key: str, default: str) -> str:
+    """Interned string value of a field, or the default if it isn't a string."""
+    value = data.get(key, default)
+    return sys.intern(value) if isinstance(value, str) else default
+
+
+def _slim_message(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Trim a message to the fields the analytics read.
+    
+    Keeps msg_id, from, to, priority, timestamp and replied_by, and caches
+    '_ts', '_epoch', '_day' and '_to_set' (replies get their own '_ts').
+    """
+    to_list = data.get("to")
+    if isinstance(to_list, str):
+        to_list = [to_list]
+    elif not isinstance(to_list, list):
+        to_list = []
+    # Names are used as dict keys, so non-string recipients are dropped
+    to_list = [sys.intern(agent) for agent in to_list if isinstance(agent, str)]
+    
+    timestamp = data.get("timestamp", "")
+    msg_time = _parse_timestamp(timestamp)
+    replied_by = data.get("replied_by")
+    if not replied_by or not isinstance(replied_by, list):
+        # Shared empty tuple: no per-message allocation for unreplied messages
+        replied_by = ()
+    
+    # Copy replies rather than annotating them, as the caller may own them
+    replies = []
+    for reply in replied_by:
+        if isinstance(reply, dict):
+            reply = {**reply, '_ts': _parse_timestamp(reply.get('timestamp'))}
+            if 'ai' in reply:
+                reply['ai'] = _intern(reply['ai'])
+        replies.append(reply)
+    replied_by = replies or ()
+    
+    return {
+        "msg_id": data.get("msg_id", ""),
+        "from": _string_field(data, "from", "UNKNOWN"),
+        "to": to_list,
+        "_to_set": frozenset(to_list),
+        "priority": _string_field(data, "priority", "NORMAL"),
+        "timestamp": timestamp,
+        "replied_by": replied_by,
+        "_ts": msg_time,
+        "_epoch": _to_epoch(msg_time),
+        "_day": _local_day(msg_time),
+    }
+
 
 @dataclass
 class MessageStats:
@@ -54,6 +177,12 @@ class SynapseStats:
         
         # Export to CSV
         stats.export_csv("synapse_report.csv")
+        
+        # Pick up messages that arrived since the first query
+        stats.reload()
+    
+    Messages are read on first use, and query results are cached per
+    instance until reload(); treat returned dicts as read-only.
     """
     
     def __init__(self, synapse_path: Optional[Path] = None):
@@ -64,22 +193,186 @@ class SynapseStats:
             synapse_path: Path to THE_SYNAPSE/active folder
         """
         self.synapse_path = synapse_path or DEFAULT_SYNAPSE_PATH
-        self.messages = self._load_all_messages()
+        self._messages = None
+        self._cache = {}
+    
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """All loaded messages, read from the Synapse on first access."""
+        self._ensure_loaded()
+        return self._messages
+    
+    @messages.setter
+    def messages(self, messages: List[Dict[str, Any]]):
+        # Accept raw message dicts (e.g. a filtered or hand-built list) as
+        # well as already loaded ones; trimming is idempotent
+        self._set_messages([_slim_message(msg) for msg in messages
+                            if isinstance(msg, dict)])
+    
+    def reload(self):
+        """Discard loaded messages and cached results."""
+        self._messages = None
+        self._cache.clear()
+    
+    def _ensure_loaded(self):
+        """Load messages and build indices if not done yet."""
+        if self._messages is None:
+            self._set_messages(self._load_all_messages())
+    
+    def _set_messages(self, messages: List[Dict[str, Any]]):
+        """Index trimmed messages, then make them current."""
+        # Index first so a failure leaves the previous state intact
+        self._build_indices(messages)
+        self._messages = messages
+        self._cache.clear()
     
     def _load_all_messages(self) -> List[Dict[str, Any]]:
-        """Load all messages from Synapse."""
+        """Load all messages from Synapse, trimmed to the analyzed fields."""
+        try:
+            with os.scandir(self.synapse_path) as entries:
+                paths = [entry.path for entry in entries
+                         if entry.name.endswith('.json') and entry.is_file()]
+        except OSError:
+            # Missing, unreadable or not a folder: report no messages, like
+            # an empty one (Path.glob behaved the same)
+            return []
+        
+        if not paths:
+            return []
+        
+        # Files are independent, so reads overlap across worker threads.
+        # One batch per worker keeps per-file scheduling overhead off the
+        # GIL, which stdlib json holds while parsing.
+        workers = min(LOAD_WORKERS, len(paths))
+        size = -(-len(paths) // workers)
+        batches = [paths[i:i + size] for i in range(0, len(paths), size)]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [msg for batch in executor.map(self._load_message_batch, batches)
+                    for msg in batch]
+    
+    @classmethod
+    def _load_message_batch(cls, paths: List[str]) -> List[Dict[str, Any]]:
+        """Load a batch of message files, dropping malformed ones."""
         messages = []
+        for path in paths:
+            msg = cls._load_message_file(path)
+            if msg is not None:
+                messages.append(msg)
+        return messages
+    
+    @staticmethod
+    def _load_message_file(path: str) -> Optional[Dict[str, Any]]:
+        """Load a single message file, or None if it is malformed."""
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except OSError as e:
+            _warn_skipped(path, e.strerror or e)
+            return None
+        
+        # Messages are JSON objects; reject empty and junk files unparsed
+        if not raw.lstrip().startswith(b'{'):
+            _warn_skipped(path, "not a JSON object")
+            return None
+        
+        try:
+            # json.loads accepts bytes directly, skipping a str decode pass
+            data = json.loads(raw)
+        except (ValueError, RecursionError) as e:
+            # JSONDecodeError, UnicodeDecodeError or nesting too deep to parse
+            _warn_skipped(path, e)
+            return None
+        
+        return _slim_message(data)
+    
+    def _build_indices(self, messages: List[Dict[str, Any]]):
+        """
+        Index message positions by sender, recipient, replier and time, and
+        gather the reply totals, reply delays and (from, to) pairs that the
+        query methods report, all in one walk over the messages. Queries are
+        then views over these results and never re-scan or re-parse.
+        
+        Everything is built locally and only stored once indexing succeeds.
+        """
+        sent_by = defaultdict(list)
+        received_by = defaultdict(list)  # direct messages only
+        broadcasts = []
+        replied_by_agent = defaultdict(set)
+        replied_count = 0
+        total_replies = 0
+        response_minutes = []
+        pairs = []
+        
+        for i, msg in enumerate(messages):
+            from_agent = msg['from']
+            sent_by[from_agent].append(i)
+            pairs.extend((from_agent, to_agent) for to_agent in msg['to'])
+            
+            to_set = msg['_to_set']
+            if "ALL_AGENTS" in to_set:
+                broadcasts.append(i)
+            else:
+                for to_agent in to_set:
+                    received_by[to_agent].append(i)
+            
+            replied_by = msg['replied_by']
+            if replied_by:
+                replied_count += 1
+                total_replies += len(replied_by)
+                for reply in replied_by:
+                    if isinstance(reply, dict):
+                        replier = reply.get('ai', '')
+                        if isinstance(replier, str):
+                            replied_by_agent[replier].add(i)
+                response_minutes.extend(self._reply_delays(msg))
+        
+        # Pivot the flat (from, to) counts into a nested dict
+        matrix = {}
+        for (from_agent, to_agent), count in Counter(pairs).items():
+            matrix.setdefault(from_agent, {})[to_agent] = count
+        
+        # Priority column counted once, shared by summary and trends
+        priority_counts = Counter(msg['priority'] for msg in messages)
+        
+        # Message positions ordered by time, for bisecting to a time window
+        by_time = sorted((msg['_epoch'], i) for i, msg in enumerate(messages)
+                         if msg['_epoch'] is not None)
+        
+        self._sent_by = sent_by
+        self._received_by = received_by
+        self._broadcasts = broadcasts
+        self._replied_by = replied_by_agent
+        self._replied_count = replied_count
+        self._total_replies = total_replies
+        self._response_minutes = response_minutes
+        self._matrix = matrix
+        self._priority_counts = priority_counts
+        self._ts_sorted = [epoch for epoch, _ in by_time]
+        self._idx_by_ts = [i for _, i in by_time]
+    
+    @staticmethod
+    def _reply_delays(msg: Dict[str, Any]) -> List[float]:
+        """Minutes between a message and each of its timestamped replies."""
+        msg_time = msg['_ts']
+        delays = []
+        
+        if msg_time is None:
+            return delays
         
-        for filepath in self.synapse_path.glob("*.json"):
+        for reply in msg['replied_by']:
+            if not isinstance(reply, dict) or reply['_ts'] is None:
+                continue
             try:
-                data = json.loads(filepath.read_text(encoding='utf-8'))
-                messages.append(data)
-            except Exception as e:
-                # Skip malformed files
-                pass
+                delta = reply['_ts'] - msg_time
+            except TypeError:
+                # Naive and timezone-aware timestamps can't be subtracted
+                continue
+            delays.append(delta.total_seconds() / 60)  # Convert to minutes
         
-        return messages
+        return delays
     
+    @_memoized
     def get_summary(self) -> Dict[str, Any]:
         """
         Get overall Synapse statistics.
@@ -92,24 +385,12 @@ class SynapseStats:
         if total == 0:
             return {"total_messages": 0, "error": "No messages found"}
         
-        # Count by sender
-        by_sender = Counter()
-        for msg in self.messages:
-            by_sender[msg.get('from', 'UNKNOWN')] += 1
+        # Count by sender (from the sender index) and priority
+        by_sender = Counter({agent: len(sent) for agent, sent in self._sent_by.items()})
+        by_priority = self._priority_counts
         
-        # Count by priority
-        by_priority = Counter()
-        for msg in self.messages:
-            by_priority[msg.get('priority', 'NORMAL')] += 1
-        
-        # Count replies
-        replied_count = 0
-        total_replies = 0
-        for msg in self.messages:
-            replied_by = msg.get('replied_by', [])
-            if replied_by:
-                replied_count += 1
-                total_replies += len(replied_by)
+        replied_count = self._replied_count
+        total_replies = self._total_replies
         
         # Calculate reply rate
         reply_rate = (replied_count / total * 100) if total > 0 else 0
@@ -139,35 +420,25 @@ class SynapseStats:
         Returns:
             Dictionary with agent-specific stats
         """
+        self._ensure_loaded()
         agent_upper = agent_name.upper()
         
         # Messages sent by agent
-        sent = [msg for msg in self.messages if msg.get('from', '') == agent_upper]
+        sent = self._sent_by.get(agent_upper, ())
         
-        # Messages received by agent
-        received = []
-        for msg in self.messages:
-            to_list = msg.get('to', [])
-            if isinstance(to_list, str):
-                to_list = [to_list]
-            if agent_upper in to_list or "ALL_AGENTS" in to_list:
-                received.append(msg)
+        # Messages received by agent, directly or as a broadcast (indexed
+        # separately, so the two counts never overlap)
+        received = len(self._received_by.get(agent_upper, ())) + len(self._broadcasts)
         
         # Messages replied to by agent
-        replied_to = []
-        for msg in self.messages:
-            replied_by = msg.get('replied_by', [])
-            for reply in replied_by:
-                if isinstance(reply, dict) and reply.get('ai', '') == agent_upper:
-                    replied_to.append(msg)
-                    break
+        replied_to = self._replied_by.get(agent_upper, ())
         
         return {
             "agent": agent_name,
             "messages_sent": len(sent),
-            "messages_received": len(received),
+            "messages_received": received,
             "messages_replied_to": len(replied_to),
-            "response_rate": f"{(len(replied_to) / len(received) * 100):.1f}%" if received else "N/A"
+            "response_rate": f"{(len(replied_to) / received * 100):.1f}%" if received else "N/A"
         }
     
     def get_timeline(self, days: int = 7) -> Dict[str, int]:
@@ -180,30 +451,23 @@ class SynapseStats:
         Returns:
             Dictionary mapping date to message count
         """
-        cutoff = datetime.now() - timedelta(days=days)
-        timeline = defaultdict(int)
-        
-        for msg in self.messages:
-            timestamp_str = msg.get('timestamp', '')
-            if timestamp_str:
-                try:
-                    # Parse timestamp
-                    msg_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    
-                    if msg_time >= cutoff:
-                        date_key = msg_time.strftime('%Y-%m-%d')
-                        timeline[date_key] += 1
-                except:
-                    pass
-        
-        # Fill in missing days with 0
-        result = {}
-        for i in range(days):
-            date = (datetime.now() - timedelta(days=days-i-1)).strftime('%Y-%m-%d')
-            result[date] = timeline.get(date, 0)
-        
-        return result
+        now = datetime.now()
+        cutoff_ts = (now - timedelta(days=days)).timestamp()
+        self._ensure_loaded()
+        
+        # Only visit messages inside the window
+        start = bisect.bisect_left(self._ts_sorted, cutoff_ts)
+        messages = self._messages
+        timeline = Counter(messages[i]['_day'] for i in self._idx_by_ts[start:])
+        
+        # Fill in missing days with 0, formatting only the output dates
+        today = now.toordinal()
+        return {
+            date.fromordinal(day).isoformat(): timeline.get(day, 0)
+            for day in range(today - days + 1, today + 1)
+        }
     
+    @_memoized
     def get_priority_trends(self) -> Dict[str, float]:
         """
         Get percentage of messages by priority level.
@@ -215,15 +479,12 @@ class SynapseStats:
         if total == 0:
             return {}
         
-        priority_counts = Counter()
-        for msg in self.messages:
-            priority_counts[msg.get('priority', 'NORMAL')] += 1
-        
         return {
             priority: (count / total * 100)
-            for priority, count in priority_counts.items()
+            for priority, count in self._priority_counts.items()
         }
     
+    @_memoized
     def get_response_times(self) -> Dict[str, Any]:
         """
         Analyze response times for messages.
@@ -231,27 +492,8 @@ class SynapseStats:
         Returns:
             Statistics on how quickly messages get replies
         """
-        response_times = []
-        
-        for msg in self.messages:
-            msg_time_str = msg.get('timestamp', '')
-            replied_by = msg.get('replied_by', [])
-            
-            if not msg_time_str or not replied_by:
-                continue
-            
-            try:
-                msg_time = datetime.fromisoformat(msg_time_str.replace('Z', '+00:00'))
-                
-                for reply in replied_by:
-                    if isinstance(reply, dict) and 'timestamp' in reply:
-                        reply_time_str = reply['timestamp']
-                        reply_time = datetime.fromisoformat(reply_time_str.replace('Z', '+00:00'))
-                        
-                        delta = reply_time - msg_time
-                        response_times.append(delta.total_seconds() / 60)  # Convert to minutes
-            except:
-                pass
+        self._ensure_loaded()
+        response_times = self._response_minutes
         
         if not response_times:
             return {
@@ -275,20 +517,8 @@ class SynapseStats:
         Returns:
             Dictionary mapping from_agent -> to_agent -> count
         """
-        matrix = defaultdict(lambda: defaultdict(int))
-        
-        for msg in self.messages:
-            from_agent = msg.get('from', 'UNKNOWN')
-            to_list = msg.get('to', [])
-            
-            if isinstance(to_list, str):
-                to_list = [to_list]
-            
-            for to_agent in to_list:
-                matrix[from_agent][to_agent] += 1
-        
-        # Convert to regular dict for JSON serialization
-        return {k: dict(v) for k, v in matrix.items()}
+        self._ensure_loaded()
+        return self._matrix
     
     def export_csv(self, filepath: str):
         """
@@ -302,29 +532,27 @@ class SynapseStats:
         with output.open('w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
-            # Write summary stats
-            writer.writerow(['=== SYNAPSE STATISTICS REPORT ==='])
-            writer.writerow([])
-            
             summary = self.get_summary()
-            writer.writerow(['Metric', 'Value'])
-            writer.writerow(['Total Messages', summary['total_messages']])
-            writer.writerow(['Reply Rate', summary['reply_rate']])
-            writer.writerow(['Most Active Agent', summary['most_active_agent']])
-            writer.writerow([])
+            
+            # Write summary stats
+            writer.writerows([
+                ['=== SYNAPSE STATISTICS REPORT ==='],
+                [],
+                ['Metric', 'Value'],
+                ['Total Messages', summary['total_messages']],
+                ['Reply Rate', summary['reply_rate']],
+                ['Most Active Agent', summary['most_active_agent']],
+                [],
+            ])
             
             # Write by sender
-            writer.writerow(['=== MESSAGES BY SENDER ==='])
-            writer.writerow(['Agent', 'Message Count'])
-            for agent, count in summary['by_sender'].items():
-                writer.writerow([agent, count])
+            writer.writerows([['=== MESSAGES BY SENDER ==='], ['Agent', 'Message Count']])
+            writer.writerows(summary['by_sender'].items())
             writer.writerow([])
             
             # Write by priority
-            writer.writerow(['=== MESSAGES BY PRIORITY ==='])
-            writer.writerow(['Priority', 'Count'])
-            for priority, count in summary['by_priority'].items():
-                writer.writerow([priority, count])
+            writer.writerows([['=== MESSAGES BY PRIORITY ==='], ['Priority', 'Count']])
+            writer.writerows(summary['by_priority'].items())
     
     def export_json(self, filepath: str):
         """Export all statistics to JSON file."""
@@ -339,7 +567,9 @@ class SynapseStats:
             "communication_matrix": self.get_communication_matrix()
         }
         
-        output.write_text(json.dumps(report, indent=2))
+        # Stream into the file rather than building the whole string first
+        with output.open('w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
 
 
 def main():
@@ -390,8 +620,8 @@ def main():
     elif args.command == 'timeline':
         timeline = stats.get_timeline(days=args.days)
         print(f"\n=== MESSAGE TIMELINE (Last {args.days} days) ===")
-        for date, count in timeline.items():
-            print(f"{date}: {count} messages")
+        for day, count in timeline.items():
+            print(f"{day}: {count} messages")
         print()
     
     elif args.command == 'export':
@@ -410,5 +640,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -4,11 +4,13 @@ SynapseStats v1.0 - Test Suite
 Comprehensive tests for Synapse communication analytics.
 """
 
+import io
 import sys
 import json
+import contextlib
 import tempfile
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -87,6 +89,59 @@ def test_load_messages():
         stats = SynapseStats(synapse_path=temp_path)
         
         results.assert_equal(len(stats.messages), 3, "Loaded 3 messages")
+        
+        # Paths that aren't readable folders yield no messages
+        missing = SynapseStats(synapse_path=temp_path / "missing")
+        results.assert_equal(len(missing.messages), 0, "Missing folder loads nothing")
+        not_folder = SynapseStats(synapse_path=temp_path / "msg_001.json")
+        results.assert_equal(len(not_folder.messages), 0, "File path loads nothing")
+    
+    return results.summary()
+
+
+def test_malformed_files():
+    """Test that malformed message files are skipped and reported."""
+    print("\n[TEST] Malformed Files")
+    results = TestResults()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        
+        create_test_message(temp_path, "msg_001", from_agent="ATLAS")
+        (temp_path / "empty.json").write_text("")
+        (temp_path / "truncated.json").write_text('{"from": "FORGE", "to": [')
+        (temp_path / "list.json").write_text('["not", "a", "message"]')
+        (temp_path / "deep.json").write_text('{"a": ' + '[' * 100000 + ']' * 100000 + '}')
+        
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            stats = SynapseStats(synapse_path=temp_path)
+            loaded = len(stats.messages)
+        
+        results.assert_equal(loaded, 1, "Only the valid message is loaded")
+        results.assert_equal(stderr.getvalue().count("[WARN] Skipping"), 4, "Skipped files are reported")
+    
+    return results.summary()
+
+
+def test_non_string_agent_fields():
+    """Test that non-string agent names don't break the aggregates."""
+    print("\n[TEST] Non-String Agent Fields")
+    results = TestResults()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        
+        create_test_message(temp_path, "msg_001", from_agent="ATLAS", to=[{"name": "FORGE"}, "CLIO"],
+                          replied_by=[{"ai": {"name": "FORGE"}, "timestamp": datetime.now().isoformat()},
+                                      {"ai": "CLIO", "timestamp": datetime.now().isoformat()}])
+        
+        stats = SynapseStats(synapse_path=temp_path)
+        
+        results.assert_equal(stats.get_summary()['total_replies'], 2, "Summary counts both replies")
+        results.assert_equal(stats.get_communication_matrix(), {'ATLAS': {'CLIO': 1}},
+                             "Matrix skips non-string recipients")
+        results.assert_equal(stats.get_agent_stats("CLIO")['messages_replied_to'], 1, "CLIO replied to 1")
     
     return results.summary()
 
@@ -136,12 +191,18 @@ def test_agent_stats():
         create_test_message(temp_path, "msg_004", from_agent="CLIO", to=["ATLAS"],
                           replied_by=[{"ai": "ATLAS", "timestamp": datetime.now().isoformat()}])
         
+        # Broadcasts, one also addressed to ATLAS directly
+        create_test_message(temp_path, "msg_005", from_agent="CLIO", to=["ATLAS", "ALL_AGENTS"])
+        create_test_message(temp_path, "msg_006", from_agent="CLIO", to=["ALL_AGENTS"])
+        
         stats = SynapseStats(synapse_path=temp_path)
         atlas_stats = stats.get_agent_stats("ATLAS")
         
         results.assert_equal(atlas_stats['messages_sent'], 2, "ATLAS sent 2 messages")
         results.assert_true(atlas_stats['messages_received'] >= 1, "ATLAS received messages")
+        results.assert_equal(atlas_stats['messages_received'], 4, "ATLAS received 4 (broadcasts counted once)")
         results.assert_equal(atlas_stats['messages_replied_to'], 1, "ATLAS replied to 1")
+        results.assert_equal(stats.get_agent_stats("FORGE")['messages_received'], 3, "FORGE received 3")
     
     return results.summary()
 
@@ -163,11 +224,17 @@ def test_timeline():
         create_test_message(temp_path, "msg_002", timestamp=today.isoformat())
         create_test_message(temp_path, "msg_003", timestamp=yesterday.isoformat())
         
+        # Outside the 7-day window
+        create_test_message(temp_path, "msg_004", timestamp=(today - timedelta(days=30)).isoformat())
+        
         stats = SynapseStats(synapse_path=temp_path)
         timeline = stats.get_timeline(days=7)
         
         results.assert_equal(len(timeline), 7, "Timeline has 7 days")
         results.assert_true(any(count > 0 for count in timeline.values()), "Timeline has data")
+        results.assert_equal(timeline[today.strftime('%Y-%m-%d')], 2, "2 messages today")
+        results.assert_equal(timeline[yesterday.strftime('%Y-%m-%d')], 1, "1 message yesterday")
+        results.assert_equal(sum(timeline.values()), 3, "Older messages excluded")
     
     return results.summary()
 
@@ -213,11 +280,139 @@ def test_communication_matrix():
         # FORGE -> CLIO (1 time)
         create_test_message(temp_path, "msg_003", from_agent="FORGE", to=["CLIO"])
         
+        # CLIO -> ATLAS (recipient given as a plain string)
+        create_test_message(temp_path, "msg_004", from_agent="CLIO", to="ATLAS")
+        
         stats = SynapseStats(synapse_path=temp_path)
         matrix = stats.get_communication_matrix()
         
         results.assert_equal(matrix['ATLAS']['FORGE'], 2, "ATLAS->FORGE: 2")
         results.assert_equal(matrix['FORGE']['CLIO'], 1, "FORGE->CLIO: 1")
+        results.assert_equal(matrix['CLIO'], {'ATLAS': 1}, "CLIO->ATLAS: 1 (string recipient)")
+        results.assert_equal(stats.get_agent_stats("ATLAS")['messages_received'], 1,
+                             "ATLAS received 1 (string recipient)")
+    
+    return results.summary()
+
+
+def test_response_times():
+    """Test response time analysis."""
+    print("\n[TEST] Response Times")
+    results = TestResults()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        
+        sent = datetime(2026, 1, 18, 12, 0, 0)
+        
+        # Replies after 10 and 30 minutes
+        create_test_message(temp_path, "msg_001", timestamp=sent.isoformat(),
+                          replied_by=[{"ai": "FORGE", "timestamp": (sent + timedelta(minutes=10)).isoformat()},
+                                      {"ai": "CLIO", "timestamp": (sent + timedelta(minutes=30)).isoformat()}])
+        
+        # No replies
+        create_test_message(temp_path, "msg_002", timestamp=sent.isoformat())
+        
+        stats = SynapseStats(synapse_path=temp_path)
+        response_times = stats.get_response_times()
+        
+        results.assert_equal(response_times['messages_analyzed'], 2, "2 replies analyzed")
+        results.assert_equal(response_times['average_minutes'], "20.0", "Average is 20 minutes")
+        results.assert_equal(response_times['fastest_minutes'], "10.0", "Fastest is 10 minutes")
+        results.assert_equal(response_times['slowest_minutes'], "30.0", "Slowest is 30 minutes")
+    
+    return results.summary()
+
+
+def test_utc_timestamps():
+    """Test timestamps with a trailing 'Z' (UTC)."""
+    print("\n[TEST] UTC Timestamps")
+    results = TestResults()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        
+        sent = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=1)
+        reply = sent + timedelta(minutes=15)
+        
+        create_test_message(temp_path, "msg_001", timestamp=sent.isoformat() + "Z",
+                          replied_by=[{"ai": "FORGE", "timestamp": reply.isoformat() + "Z"}])
+        
+        stats = SynapseStats(synapse_path=temp_path)
+        response_times = stats.get_response_times()
+        timeline = stats.get_timeline(days=7)
+        
+        results.assert_equal(response_times['messages_analyzed'], 1, "UTC reply analyzed")
+        results.assert_equal(response_times['average_minutes'], "15.0", "UTC reply after 15 minutes")
+        results.assert_equal(sum(timeline.values()), 1, "UTC message on timeline")
+    
+    return results.summary()
+
+
+def test_timeline_offset_timestamps():
+    """Test that offset timestamps are bucketed on the local calendar day."""
+    print("\n[TEST] Timeline Offset Timestamps")
+    results = TestResults()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        
+        # A moment early (or late) today locally, written in a zone 12 hours
+        # away, so its own date is yesterday (or tomorrow)
+        local_now = datetime.now().astimezone()
+        local_offset = local_now.utcoffset()
+        if local_offset >= timedelta(0):
+            moment = local_now.replace(hour=0, minute=30, second=0, microsecond=0)
+            offset = local_offset - timedelta(hours=12)
+        else:
+            moment = local_now.replace(hour=23, minute=30, second=0, microsecond=0)
+            offset = local_offset + timedelta(hours=12)
+        
+        create_test_message(temp_path, "msg_001",
+                          timestamp=moment.astimezone(timezone(offset)).isoformat())
+        
+        stats = SynapseStats(synapse_path=temp_path)
+        timeline = stats.get_timeline(days=3)
+        
+        results.assert_equal(timeline[local_now.strftime('%Y-%m-%d')], 1, "Counted on local today")
+        results.assert_equal(sum(timeline.values()), 1, "Counted once")
+    
+    return results.summary()
+
+
+def test_lazy_loading_and_reload():
+    """Test lazy loading, cached results and reload."""
+    print("\n[TEST] Lazy Loading and Reload")
+    results = TestResults()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        
+        # Messages written after construction are still seen on first use
+        stats = SynapseStats(synapse_path=temp_path)
+        create_test_message(temp_path, "msg_001", from_agent="ATLAS")
+        
+        results.assert_equal(stats.get_summary()['total_messages'], 1, "Loaded on first query")
+        
+        # Results are cached until reload()
+        create_test_message(temp_path, "msg_002", from_agent="FORGE")
+        results.assert_equal(stats.get_summary()['total_messages'], 1, "Summary cached")
+        
+        stats.reload()
+        results.assert_equal(stats.get_summary()['total_messages'], 2, "Reload picks up new messages")
+        results.assert_equal(stats.get_agent_stats("FORGE")['messages_sent'], 1, "Agent index rebuilt")
+        
+        # Assigning messages, filtered or raw, re-indexes them
+        stats.messages = [msg for msg in stats.messages if msg['from'] == "ATLAS"]
+        results.assert_equal(stats.get_summary()['total_messages'], 1, "Filtered messages indexed")
+        
+        raw = [{"from": "CLIO", "to": "ATLAS", "priority": "HIGH",
+                "replied_by": [{"ai": "ATLAS", "timestamp": datetime.now().isoformat()}]}]
+        raw_before = json.dumps(raw)
+        stats.messages = raw
+        results.assert_equal(stats.get_agent_stats("ATLAS")['messages_received'], 1, "Raw messages accepted")
+        results.assert_equal(stats.get_priority_trends(), {'HIGH': 100.0}, "Raw message priority counted")
+        results.assert_equal(json.dumps(raw), raw_before, "Assigned raw messages left unchanged")
     
     return results.summary()
 
@@ -282,11 +477,17 @@ def run_all_tests():
     all_passed = True
     
     all_passed &= test_load_messages()
+    all_passed &= test_malformed_files()
+    all_passed &= test_non_string_agent_fields()
     all_passed &= test_summary_stats()
     all_passed &= test_agent_stats()
     all_passed &= test_timeline()
     all_passed &= test_priority_trends()
     all_passed &= test_communication_matrix()
+    all_passed &= test_response_times()
+    all_passed &= test_utc_timestamps()
+    all_passed &= test_timeline_offset_timestamps()
+    all_passed &= test_lazy_loading_and_reload()
     all_passed &= test_export_csv()
     all_passed &= test_export_json()
     